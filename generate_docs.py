@@ -3,21 +3,120 @@
 Generate JSON-LD documentation files from Gleam standard library source code.
 """
 
+import argparse
+import hashlib
+import io
 import json
 import re
+import sys
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import accumulate, repeat
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, BinaryIO, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+
+# Parsed modules are cached here, keyed on their contents and this script's source
+CACHE_DIR = Path('.cache/gleam-docs')
+_SCRIPT_VERSION = hashlib.blake2b(Path(__file__).read_bytes(), digest_size=8).hexdigest()
+
+# Patterns used while parsing, compiled once at import time
+_RE_CODE_BLOCK = re.compile(r'```gleam\n(.*?)\n```', re.MULTILINE | re.DOTALL)
+_RE_PUB_FN = re.compile(r'pub fn (\w+)\(')
+_RE_PUB_FN_LINE = re.compile(r'^[^\S\n]*pub fn ', re.MULTILINE)
+_RE_RETURN = re.compile(r'\)\s*->\s*([^{]+)')
+_RE_PARENS = re.compile(r'[()]')
+_RE_PARAM_DELIMS = re.compile(r'->|[<>(),]')
+_RE_MODULE_DOC = re.compile(r'^////\s*(.+?)(?=\n\n|\n[^/]|\Z)', re.MULTILINE | re.DOTALL)
+_RE_FENCED = re.compile(r'```.*?```', re.DOTALL)
+_RE_FENCE_TAIL = re.compile(r'```.*')
+
+# Sentences explaining usefulness, in order of preference, each paired with
+# a lowercase literal that must be present for the pattern to match
+_HELPFUL_SOURCES = (
+    ('this', r'This function[^.]+\.[^.]*\.'),
+    ('useful', r'Useful[^.]+\.[^.]*\.'),
+    ('this', r'This[^.]+\.[^.]*\.'),
+)
+_HELPFUL_PATTERNS = tuple((literal, re.compile(p, re.IGNORECASE)) for literal, p in _HELPFUL_SOURCES)
+# Any of the above; finds where the earliest candidate sentence starts
+_RE_HELPFUL = re.compile('|'.join(p for _, p in _HELPFUL_SOURCES), re.IGNORECASE)
+
+# JSON-LD context shared by every generated file, never mutated
+_CONTEXT = {
+    '@vocab': 'https://aalang.org/spec',
+    'ex': 'https://aalang.org/example/'
+}
+
+# Module name -> JSON-LD id fragment, and module name -> output file path
+_ID_TRANS = str.maketrans({'.': '_', '/': '_'})
+_PATH_TRANS = str.maketrans({'.': '/'})
+
+if numba is not None:
+    @numba.njit(cache=True)
+    def _split_params_indices(buf):
+        """Return the offsets of top-level commas in an ASCII parameter list."""
+        out = np.empty(len(buf), np.int64)
+        n = 0
+        depth = 0
+        i = 0
+        while i < len(buf):
+            c = buf[i]
+            if c == 45 and i + 1 < len(buf) and buf[i + 1] == 62:  # '->'
+                # Function arrow, its > never closes a generic
+                i += 1
+            elif c == 40 or c == 60:  # '(' '<'
+                depth += 1
+            elif c == 41 or c == 62:  # ')' '>'
+                depth -= 1
+            elif c == 44 and depth == 0:  # ','
+                out[n] = i
+                n += 1
+            i += 1
+        return out[:n]
+else:
+    _split_params_indices = None
+
+def _top_level_commas(params_str: str) -> List[int]:
+    """Find the commas separating parameters, skipping those in nested types."""
+    # Byte offsets only match string offsets for ASCII text
+    if _split_params_indices is not None and params_str.isascii():
+        buf = np.frombuffer(params_str.encode('ascii'), np.uint8)
+        return _split_params_indices(buf).tolist()
+    
+    commas = []
+    depth = 0
+    for delim in _RE_PARAM_DELIMS.finditer(params_str):
+        char = delim.group()
+        if char == '(' or char == '<':
+            depth += 1
+        elif char == ')' or char == '>':
+            depth -= 1
+        elif char == ',' and depth == 0:
+            commas.append(delim.start())
+        # Function arrow -> is matched whole, so its > never closes a generic
+    return commas
 
 def extract_examples(doc: str) -> List[str]:
-    """Extract single-line code examples from documentation."""
+    """Extract single-line code examples from documentation with the /// prefixes removed."""
+    # Most doc comments have no examples; skip the regex work entirely
+    if '```gleam' not in doc:
+        return []
     examples = []
+    seen = set()
     # Look for code blocks with examples
-    # Format: /// ```gleam\n/// function_call\n/// // -> result\n/// ```
-    # Remove /// prefix first
-    doc_clean = re.sub(r'^///\s*', '', doc, flags=re.MULTILINE)
-    
-    # Find code blocks
-    code_blocks = re.finditer(r'```gleam\n(.*?)\n```', doc_clean, re.MULTILINE | re.DOTALL)
+    # Format: ```gleam\nfunction_call\n// -> result\n```
+    code_blocks = _RE_CODE_BLOCK.finditer(doc)
     for block_match in code_blocks:
         block_content = block_match.group(1)
         # Find lines that end with // ->
@@ -32,7 +131,8 @@ def extract_examples(doc: str) -> List[str]:
                     if example.startswith('|>'):
                         example = example[2:].strip()
                     # Skip if it's a variable declaration or empty
-                    if not example.startswith('let ') and example and example not in examples:
+                    if not example.startswith('let ') and example and example not in seen:
+                        seen.add(example)
                         examples.append(example)
                         if len(examples) >= 4:
                             return examples
@@ -40,6 +140,13 @@ def extract_examples(doc: str) -> List[str]:
 
 def parse_function_signature(lines: List[str], start_idx: int) -> Optional[Dict[str, Any]]:
     """Parse a function signature, potentially spanning multiple lines."""
+    # Most signatures fit on the pub fn line, so try that on its own first
+    first = lines[start_idx].strip()
+    if first.endswith('{') and ') ->' in first:
+        func_info = _parse_signature_text(first)
+        if func_info:
+            return func_info
+    
     # Collect the full signature
     sig_lines = []
     i = start_idx
@@ -47,15 +154,17 @@ def parse_function_signature(lines: List[str], start_idx: int) -> Optional[Dict[
         line = lines[i].strip()
         sig_lines.append(line)
         # Check if we've reached the function body (starts with {)
-        if '{' in line and not line.strip().startswith('pub fn'):
+        if '{' in line and not line.startswith('pub fn'):
             break
         i += 1
     
-    full_sig = ' '.join(sig_lines)
-    
+    return _parse_signature_text(' '.join(sig_lines))
+
+def _parse_signature_text(full_sig: str) -> Optional[Dict[str, Any]]:
+    """Parse a function signature joined onto a single line."""
     # Match: pub fn function_name(params) -> ReturnType
     # Need to find the closing paren of params and the return type
-    match = re.search(r'pub fn (\w+)\(', full_sig)
+    match = _RE_PUB_FN.search(full_sig)
     if not match:
         return None
     
@@ -65,72 +174,45 @@ def parse_function_signature(lines: List[str], start_idx: int) -> Optional[Dict[
     # Find matching closing paren for parameters
     depth = 1
     params_end = params_start
-    for i in range(params_start, len(full_sig)):
-        if full_sig[i] == '(':
+    for paren in _RE_PARENS.finditer(full_sig, params_start):
+        if paren.group() == '(':
             depth += 1
-        elif full_sig[i] == ')':
+        else:
             depth -= 1
             if depth == 0:
-                params_end = i
+                params_end = paren.start()
                 break
     
     params_str = full_sig[params_start:params_end].strip()
     
     # Find return type (after -> and before {)
-    return_match = re.search(r'\)\s*->\s*([^{]+)', full_sig[params_end:])
+    return_match = _RE_RETURN.search(full_sig, params_end)
     if not return_match:
         return None
     
-    return_type = return_match.group(1).strip()
+    # Types, labels and names recur across thousands of functions, so intern them
+    return_type = sys.intern(return_match.group(1).strip())
     
     # Parse parameters - need to handle nested generics and function types
     parameters = []
     if params_str:
-        # Split parameters manually, accounting for nested generics and function types
-        param_parts = []
-        current = ""
-        depth = 0
-        in_fn = False
-        i = 0
-        while i < len(params_str):
-            char = params_str[i]
-            if char == '(' or char == '<':
-                depth += 1
-                current += char
-            elif char == ')' or char == '>':
-                depth -= 1
-                current += char
-            elif char == '-' and i + 1 < len(params_str) and params_str[i+1] == '>':
-                # Function arrow ->, not a parameter separator
-                current += "->"
-                i += 1
-            elif char == ',' and depth == 0:
-                if current.strip():
-                    param_parts.append(current.strip())
-                current = ""
-            else:
-                current += char
-            i += 1
-        if current.strip():
-            param_parts.append(current.strip())
-        
-        # Parse each parameter
-        for param_str in param_parts:
-            param_str = param_str.strip()
-            if not param_str:
-                continue
-            
+        # Split parameters on top-level commas, accounting for nested generics
+        # and function types, and parse each in place by its offsets
+        param_start = 0
+        for param_end in _top_level_commas(params_str) + [len(params_str)]:
             # Pattern: (label )?name: Type
-            match = re.match(r'(?:(\w+)\s+)?(\w+)\s*:\s*(.+)', param_str)
-            if match:
-                label = match.group(1)
-                param_name = match.group(2)
-                param_type = match.group(3).strip()
-                parameters.append({
-                    'name': param_name,
-                    'label': label,
-                    'type': param_type
-                })
+            colon = params_str.find(':', param_start, param_end)
+            if colon != -1:
+                head = params_str[param_start:colon].split()
+                param_type = params_str[colon + 1:param_end].strip()
+                # Labels and names are plain Gleam identifiers
+                if param_type and 1 <= len(head) <= 2 and all(word.isidentifier() for word in head):
+                    parameters.append({
+                        'name': sys.intern(head[-1]),
+                        'label': sys.intern(head[0]) if len(head) == 2 else None,
+                        'type': sys.intern(param_type)
+                    })
+            param_start = param_end + 1
     
     return {
         'name': name,
@@ -138,16 +220,63 @@ def parse_function_signature(lines: List[str], start_idx: int) -> Optional[Dict[
         'returnType': return_type
     }
 
-def parse_gleam_file(file_path: Path) -> Dict[str, Any]:
-    """Parse a Gleam file and extract module and function information."""
-    content = file_path.read_text()
+def _cache_key(rel_path: Path, raw: bytes) -> str:
+    """Build the cache key for a source file from its path and contents."""
+    digest = hashlib.blake2b(str(rel_path).encode('utf-8'), digest_size=16)
+    digest.update(b'\0')
+    digest.update(raw)
+    return f"{digest.hexdigest()}-{_SCRIPT_VERSION}"
+
+def _prune_cache(cache_dir: Path) -> None:
+    """Delete cache entries written by other versions of this script."""
+    suffix = f"-{_SCRIPT_VERSION}"
+    for entry in cache_dir.glob('*.json'):
+        if not entry.stem.endswith(suffix):
+            entry.unlink(missing_ok=True)
+
+def _intern_cached(module_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Re-intern the strings of a module loaded from the cache, as parsing does."""
+    module_name = sys.intern(module_data['name'])
+    module_data['name'] = module_name
+    for func in module_data['functions']:
+        func['module'] = module_name
+        func['returnType'] = sys.intern(func['returnType'])
+        for param in func['parameters']:
+            param['name'] = sys.intern(param['name'])
+            if param['label'] is not None:
+                param['label'] = sys.intern(param['label'])
+            param['type'] = sys.intern(param['type'])
+    return module_data
+
+def parse_gleam_file(file_path: Path, cache_dir: Optional[Path] = None) -> Dict[str, Any]:
+    """Parse a Gleam file and extract module and function information.
+
+    When ``cache_dir`` is given, results are reused from and stored in it.
+    """
+    raw = file_path.read_bytes()
     
     # Extract module name from path
     rel_path = file_path.relative_to('gleam-stdlib/src')
-    module_name = str(rel_path).replace('.gleam', '').replace('/', '.')
+    module_name = sys.intern(str(rel_path).replace('.gleam', '').replace('/', '.'))
+    
+    # Modules without public functions are dropped by the caller, so skip
+    # decoding and parsing them
+    if b'pub fn ' not in raw:
+        return {'name': module_name, 'description': '', 'functions': []}
+    
+    cache_file = None
+    if cache_dir is not None:
+        cache_file = cache_dir / f"{_cache_key(rel_path, raw)}.json"
+        try:
+            return _intern_cached(json.loads(cache_file.read_bytes()))
+        except (OSError, ValueError):
+            pass  # Missing or unreadable entry, parse the file
+    
+    # Normalise newlines the way read_text() does
+    content = raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
     
     # Extract module-level documentation (//// comments)
-    module_doc_match = re.search(r'^////\s*(.+?)(?=\n\n|\n[^/]|\Z)', content, re.MULTILINE | re.DOTALL)
+    module_doc_match = _RE_MODULE_DOC.search(content)
     module_description = ''
     if module_doc_match:
         module_description = module_doc_match.group(1).strip()
@@ -155,94 +284,137 @@ def parse_gleam_file(file_path: Path) -> Dict[str, Any]:
     # Find all public functions
     functions = []
     lines = content.split('\n')
-    i = 0
-    while i < len(lines):
-        line = lines[i]
+    # Offset of the start of each line, to map matches back to line numbers
+    line_offsets = list(accumulate((len(line) + 1 for line in lines[:-1]), initial=0))
+    for match in _RE_PUB_FN_LINE.finditer(content):
+        i = bisect_right(line_offsets, match.start()) - 1
+        
+        # Collect documentation before the function
+        j = i - 1
+        while j >= 0 and lines[j].lstrip().startswith('///'):
+            j -= 1
         
-        # Check if this is a public function
-        if line.strip().startswith('pub fn '):
-            # Collect documentation before the function
-            doc_lines = []
-            j = i - 1
-            while j >= 0 and lines[j].strip().startswith('///'):
-                doc_lines.insert(0, lines[j])
-                j -= 1
+        # Parse function signature (may span multiple lines)
+        func_info = parse_function_signature(lines, i)
+        if func_info:
+            # Documentation lines without the /// prefixes
+            doc_lines = [doc_line.strip()[3:].strip() for doc_line in lines[j + 1:i]]
+            
+            # Walk the doc once, picking up the purpose (first doc line, skipping
+            # empty lines), a fallback for whyHelpful (a later line of
+            # reasonable length) and the text before the Examples section
+            purpose = ''
+            fallback_helpful = ''
+            helpful_lines = []
+            in_examples = False
+            for index, doc_line in enumerate(doc_lines):
+                if not in_examples:
+                    if '## Examples' in doc_line:
+                        helpful_lines.append(doc_line[:doc_line.index('## Examples')])
+                        in_examples = True
+                    else:
+                        helpful_lines.append(doc_line)
+                # Inline /// markers are dropped too, not just the prefix
+                clean_line = doc_line.replace('///', '').strip() if '///' in doc_line else doc_line
+                if not clean_line or clean_line.startswith('##'):
+                    continue
+                if not purpose:
+                    purpose = clean_line
+                if index and not fallback_helpful and '```' not in clean_line and 10 < len(clean_line) < 200:
+                    fallback_helpful = clean_line
+                if in_examples and fallback_helpful:
+                    break
             
-            doc_text = '\n'.join(doc_lines)
+            # Extract why helpful from documentation (before Examples section)
+            why_helpful = ''
+            # Remove code blocks for whyHelpful extraction
+            doc_for_helpful = '\n'.join(helpful_lines)
+            if '```' in doc_for_helpful:
+                doc_for_helpful = _RE_FENCED.sub('', doc_for_helpful)
             
-            # Parse function signature (may span multiple lines)
-            func_info = parse_function_signature(lines, i)
-            if func_info:
-                # Extract purpose from first doc line (skip empty lines)
-                purpose = ''
-                for doc_line in doc_lines:
-                    clean_line = doc_line.replace('///', '').strip()
-                    if clean_line and not clean_line.startswith('##'):
-                        purpose = clean_line
-                        break
-                
-                # Extract why helpful from documentation (before Examples section)
-                why_helpful = ''
-                # Remove Examples section and code blocks for whyHelpful extraction
-                doc_for_helpful = re.sub(r'## Examples.*', '', doc_text, flags=re.DOTALL)
-                doc_for_helpful = re.sub(r'```.*?```', '', doc_for_helpful, flags=re.DOTALL)
-                
-                # Look for sentences explaining usefulness
-                helpful_patterns = [
-                    r'This function[^.]+\.[^.]*\.',
-                    r'Useful[^.]+\.[^.]*\.',
-                    r'This[^.]+\.[^.]*\.',
-                ]
-                for pattern in helpful_patterns:
-                    helpful_match = re.search(pattern, doc_for_helpful, re.IGNORECASE)
+            # Look for sentences explaining usefulness
+            lower = doc_for_helpful.lower()
+            candidate = None
+            if 'this' in lower or 'useful' in lower:
+                candidate = _RE_HELPFUL.search(doc_for_helpful)
+            if candidate:
+                # The alternation returns the leftmost match rather than the
+                # preferred one, so only use it to skip ahead: no pattern can
+                # match before it
+                for literal, pattern in _HELPFUL_PATTERNS:
+                    if literal not in lower:
+                        continue
+                    helpful_match = pattern.search(doc_for_helpful, candidate.start())
                     if helpful_match:
                         why_helpful = helpful_match.group(0).strip()
                         # Clean up - remove markdown and extra whitespace
-                        why_helpful = re.sub(r'///', '', why_helpful)
-                        why_helpful = re.sub(r'```.*', '', why_helpful)  # Remove any remaining markdown
+                        if '///' in why_helpful:
+                            why_helpful = why_helpful.replace('///', '')
+                        if '```' in why_helpful:
+                            why_helpful = _RE_FENCE_TAIL.sub('', why_helpful)  # Remove any remaining markdown
                         why_helpful = ' '.join(why_helpful.split())
                         # Only use if it's a reasonable length and doesn't contain markdown
                         if len(why_helpful) > 10 and '```' not in why_helpful:
                             break
                         else:
                             why_helpful = ''
-                
-                # If no specific helpful text, use second doc line if available
-                if not why_helpful and len(doc_lines) > 1:
-                    for doc_line in doc_lines[1:]:
-                        clean_line = doc_line.replace('///', '').strip()
-                        if clean_line and not clean_line.startswith('##') and '```' not in clean_line and len(clean_line) < 200 and len(clean_line) > 10:
-                            why_helpful = clean_line
-                            break
-                
-                # Extract examples
-                examples = extract_examples(doc_text)
-                
-                func_info['purpose'] = purpose
-                func_info['whyHelpful'] = why_helpful
-                func_info['examples'] = examples
-                func_info['module'] = module_name
-                
-                functions.append(func_info)
-        
-        i += 1
+            
+            # If no specific helpful text, use second doc line if available
+            if not why_helpful:
+                why_helpful = fallback_helpful
+            
+            # Extract examples, ignoring blank doc lines
+            examples = extract_examples('\n'.join(doc_line for doc_line in doc_lines if doc_line))
+            
+            func_info['purpose'] = purpose
+            func_info['whyHelpful'] = why_helpful
+            func_info['examples'] = examples
+            func_info['module'] = module_name
+            
+            functions.append(func_info)
     
-    return {
+    module_data = {
         'name': module_name,
         'description': module_description,
         'functions': functions
     }
+    
+    if cache_file is not None:
+        # Write then rename so an interrupted run never leaves a partial entry
+        tmp_file = cache_file.with_suffix('.tmp')
+        try:
+            tmp_file.write_bytes(_dump_json(module_data))
+            tmp_file.replace(cache_file)
+        except OSError:
+            # The cache is best-effort, a failed write must not lose the module
+            tmp_file.unlink(missing_ok=True)
+    
+    return module_data
 
-def generate_module_jsonld(module_data: Dict[str, Any]) -> Dict[str, Any]:
-    """Generate JSON-LD structure for a module."""
-    module_id = module_data['name'].replace('.', '_').replace('/', '_')
+def generate_module_jsonld(module_data: Dict[str, Any], out: BinaryIO) -> None:
+    """Write the JSON-LD structure for a module to ``out`` one node at a time."""
+    module_id = module_data['name'].translate(_ID_TRANS)
+    
+    # Nodes are serialized on their own and re-indented to their depth in
+    # the document, matching what dumping the whole structure would produce
+    out.write(b'{\n  "@context": ')
+    out.write(_dump_json(_CONTEXT).replace(b'\n', b'\n  '))
+    out.write(b',\n  "@graph": [\n    ')
+    
+    # Create module node
+    module_node = {
+        '@id': f"ex:{module_id}_module",
+        '@type': 'Module',
+        'name': module_data['name'],
+        'description': module_data.get('description', ''),
+        'functions': [{'@id': f"ex:{module_id}_{func['name']}"} for func in module_data['functions']]
+    }
+    out.write(_dump_json(module_node).replace(b'\n', b'\n    '))
     
     # Create function nodes
-    function_nodes = []
     for func in module_data['functions']:
-        func_id = f"ex:{module_id}_{func['name']}"
         function_node = {
-            '@id': func_id,
+            '@id': f"ex:{module_id}_{func['name']}",
             '@type': 'Function',
             'name': func['name'],
             'module': module_data['name'],
@@ -252,42 +424,25 @@ def generate_module_jsonld(module_data: Dict[str, Any]) -> Dict[str, Any]:
             'whyHelpful': func.get('whyHelpful', ''),
             'examples': func.get('examples', [])
         }
-        function_nodes.append(function_node)
-    
-    # Create module node
-    module_node = {
-        '@id': f"ex:{module_id}_module",
-        '@type': 'Module',
-        'name': module_data['name'],
-        'description': module_data.get('description', ''),
-        'functions': [{'@id': fn['@id']} for fn in function_nodes]
-    }
+        out.write(b',\n    ')
+        out.write(_dump_json(function_node).replace(b'\n', b'\n    '))
     
-    return {
-        '@context': {
-            '@vocab': 'https://aalang.org/spec',
-            'ex': 'https://aalang.org/example/'
-        },
-        '@graph': [module_node] + function_nodes
-    }
+    out.write(b'\n  ]\n}')
 
 def generate_docs_jsonld(modules: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Generate the main docs.jsonld index file."""
     module_refs = []
     for module_data in modules:
-        module_id = module_data['name'].replace('.', '_').replace('/', '_')
+        module_id = module_data['name'].translate(_ID_TRANS)
         module_refs.append({
             '@id': f"ex:{module_id}_module",
             'name': module_data['name'],
-            'file': f"{module_data['name'].replace('.', '/')}.jsonld",
+            'file': f"{module_data['name'].translate(_PATH_TRANS)}.jsonld",
             'functionCount': len(module_data['functions'])
         })
     
     return {
-        '@context': {
-            '@vocab': 'https://aalang.org/spec',
-            'ex': 'https://aalang.org/example/'
-        },
+        '@context': _CONTEXT,
         '@graph': [
             {
                 '@id': 'ex:docs_index',
@@ -349,50 +504,71 @@ def generate_types_jsonld() -> Dict[str, Any]:
     ]
     
     return {
-        '@context': {
-            '@vocab': 'https://aalang.org/spec',
-            'ex': 'https://aalang.org/example/'
-        },
+        '@context': _CONTEXT,
         '@graph': types
     }
 
+def _dump_json(data: Any) -> bytes:
+    """Serialize data as indented UTF-8 JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    # Match orjson's output so the generated files don't depend on the backend
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+def _parse_gleam_file_safe(file_path: Path, cache_dir: Optional[Path]) -> Optional[Dict[str, Any]]:
+    """Parse a Gleam file in a worker process, reporting errors instead of raising."""
+    try:
+        return parse_gleam_file(file_path, cache_dir)
+    except Exception as e:
+        print(f"Error parsing {file_path}: {e}")
+        return None
+
+def _render_module_file(module_data: Dict[str, Any]) -> Tuple[Path, bytes]:
+    """Generate the JSON-LD file for a module, returning its path and contents."""
+    buffer = io.BytesIO()
+    generate_module_jsonld(module_data, buffer)
+    module_file = module_data['name'].translate(_PATH_TRANS) + '.jsonld'
+    return Path(module_file), buffer.getvalue()
+
 def main():
     """Main function to generate all documentation files."""
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument('--no-cache', action='store_true',
+                        help=f"re-parse every file instead of reusing results from {CACHE_DIR}")
+    args = parser.parse_args()
+    
     stdlib_path = Path('gleam-stdlib/src/gleam')
+    cache_dir = None
+    if not args.no_cache:
+        cache_dir = CACHE_DIR
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        _prune_cache(cache_dir)
     
-    # Parse all modules
-    modules = []
-    for file_path in sorted(stdlib_path.rglob('*.gleam')):
-        try:
-            module_data = parse_gleam_file(file_path)
-            if module_data['functions']:  # Only include modules with functions
+    with ProcessPoolExecutor() as executor:
+        # Parse all modules, one file per task
+        modules = []
+        paths = sorted(stdlib_path.rglob('*.gleam'))
+        for module_data in executor.map(_parse_gleam_file_safe, paths, repeat(cache_dir), chunksize=8):
+            if module_data and module_data['functions']:  # Only include modules with functions
                 modules.append(module_data)
-        except Exception as e:
-            print(f"Error parsing {file_path}: {e}")
-            continue
+        
+        # Render docs.jsonld, gleam/gleam-types.jsonld and the module files
+        outputs = [
+            (Path('docs.jsonld'), _dump_json(generate_docs_jsonld(modules))),
+            (Path('gleam/gleam-types.jsonld'), _dump_json(generate_types_jsonld())),
+        ]
+        outputs.extend(executor.map(_render_module_file, modules))
     
-    # Generate docs.jsonld
-    docs_data = generate_docs_jsonld(modules)
-    with open('docs.jsonld', 'w') as f:
-        json.dump(docs_data, f, indent=2)
-    print(f"Generated docs.jsonld with {len(modules)} modules")
+    # Create directory structure, then write the files from a thread pool
+    # since writing is I/O bound
+    for directory in {file_path.parent for file_path, _ in outputs}:
+        directory.mkdir(parents=True, exist_ok=True)
+    with ThreadPoolExecutor() as writer:
+        list(writer.map(Path.write_bytes, *zip(*outputs)))
     
-    # Generate gleam/gleam-types.jsonld
-    types_data = generate_types_jsonld()
-    with open('gleam/gleam-types.jsonld', 'w') as f:
-        json.dump(types_data, f, indent=2)
+    print(f"Generated docs.jsonld with {len(modules)} modules")
     print("Generated gleam/gleam-types.jsonld")
-    
-    # Generate module files
-    for module_data in modules:
-        module_jsonld = generate_module_jsonld(module_data)
-        # Create directory structure
-        module_file = module_data['name'].replace('.', '/') + '.jsonld'
-        file_path = Path(module_file)
-        file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(file_path, 'w') as f:
-            json.dump(module_jsonld, f, indent=2)
+    for module_data, (module_file, _) in zip(modules, outputs[2:]):
         print(f"Generated {module_file} with {len(module_data['functions'])} functions")
 
 if __name__ == '__main__':